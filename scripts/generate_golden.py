@@ -3,24 +3,76 @@
 
 Usage:
     # With the .venv-golden virtualenv activated:
-    python scripts/generate_golden.py
+    python scripts/generate_golden.py [--pretty] [--verify]
 
 Reads PDFs from crates/pdfplumber/tests/fixtures/pdfs/
 Writes JSON to crates/pdfplumber/tests/fixtures/golden/
 """
 
+import argparse
+import contextlib
+import io
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from operator import itemgetter
 
 import pdfplumber
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(SCRIPT_DIR)
 PDF_DIR = os.path.join(REPO_ROOT, "crates", "pdfplumber", "tests", "fixtures", "pdfs")
 GOLDEN_DIR = os.path.join(REPO_ROOT, "crates", "pdfplumber", "tests", "fixtures", "golden")
+PDFPLUMBER_VERSION = pdfplumber.__version__
 
 COORD_DECIMALS = 4
+MAX_WORKERS = 6
+# PDFs with at least this many pages are split across workers page by page;
+# below it, reopening the document per page costs more than it saves.
+PAGE_PARALLEL_MIN_PAGES = 50
+# Items of the "pages" array sit two levels deep in the document.
+PAGE_INDENT = b"    "
+# Golden files run to several MB; a 1 MiB buffer keeps output to a few large
+# write() calls instead of hundreds with the 8 KiB default.
+WRITE_BUFFER_SIZE = 1 << 20
+# With the default "lines" strategy a table needs at least one cell, i.e. two
+# horizontal and two vertical edges; pages with fewer skip find_tables().
+MIN_TABLE_EDGES = 4
+
+
+def encode_json(data, pretty=False):
+    """Encode data as UTF-8 JSON bytes, using orjson when available.
+
+    Output is compact unless pretty is set: the golden files are read by the
+    Rust tests, and indentation roughly triples their size. The two encoders
+    spell some floats differently (orjson writes 1e19 and 1e-7 where json
+    writes 1e+19 and 1e-07, and null where json writes NaN or Infinity), so
+    regenerating with the other one changes those bytes but not the values
+    the Rust tests read.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 def round_coord(v):
@@ -30,63 +82,116 @@ def round_coord(v):
     return round(float(v), COORD_DECIMALS)
 
 
-def extract_char(c):
-    """Extract a char dict with only the fields we care about."""
-    return {
-        "text": c.get("text", ""),
-        "x0": round_coord(c.get("x0")),
-        "top": round_coord(c.get("top")),
-        "x1": round_coord(c.get("x1")),
-        "bottom": round_coord(c.get("bottom")),
-        "fontname": c.get("fontname", ""),
-        "size": round_coord(c.get("size")),
-        "doctop": round_coord(c.get("doctop")),
-        "upright": c.get("upright", True),
-    }
-
-
-def extract_word(w):
-    """Extract a word dict."""
-    return {
-        "text": w.get("text", ""),
-        "x0": round_coord(w.get("x0")),
-        "top": round_coord(w.get("top")),
-        "x1": round_coord(w.get("x1")),
-        "bottom": round_coord(w.get("bottom")),
-        "doctop": round_coord(w.get("doctop")),
-    }
-
-
-def extract_line(obj):
-    """Extract a line dict."""
-    return {
-        "x0": round_coord(obj.get("x0")),
-        "top": round_coord(obj.get("top")),
-        "x1": round_coord(obj.get("x1")),
-        "bottom": round_coord(obj.get("bottom")),
-        "linewidth": round_coord(obj.get("linewidth", obj.get("line_width"))),
-    }
-
-
-def extract_rect(obj):
-    """Extract a rect dict."""
-    return {
-        "x0": round_coord(obj.get("x0")),
-        "top": round_coord(obj.get("top")),
-        "x1": round_coord(obj.get("x1")),
-        "bottom": round_coord(obj.get("bottom")),
-        "linewidth": round_coord(obj.get("linewidth", obj.get("line_width"))),
-        "stroke": obj.get("stroke", obj.get("stroking_color") is not None),
-        "fill": obj.get("fill", obj.get("non_stroking_color") is not None),
-    }
+def round_coords(rows):
+    """Round a list of coordinate rows to COORD_DECIMALS places.
+
+    With NumPy available this is one vectorized pass over the whole page
+    instead of a round_coord() call per value. None is carried through as NaN.
+    """
+    if np is None or not rows:
+        return [[round_coord(v) for v in row] for row in rows]
+    coords = np.array(rows, dtype=np.float64)
+    scale = 10.0 ** COORD_DECIMALS
+    scaled = coords * scale
+    rounded = np.rint(scaled) / scale
+    # Scaling can push a value across a .5 boundary, where np.rint then
+    # disagrees with round()'s correctly-rounded result. Golden data must not
+    # drift, so redo those rare near-ties with round(). The product is only
+    # accurate to half an ulp, so the window grows with magnitude; from 2**52
+    # up scaled has no fraction left and every value is redone.
+    tie_window = 1e-6 + np.abs(scaled) * 2.0 ** -52
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < tie_window
+    for i, j in zip(*np.nonzero(near_tie)):
+        rounded[i, j] = round(float(coords[i, j]), COORD_DECIMALS)
+    rounded = rounded.tolist()
+    if np.isnan(coords).any():
+        rounded = [[None if v != v else v for v in row] for row in rounded]
+    return rounded
+
+
+# pdfplumber always sets these keys on chars and words, so the coordinate rows
+# can be gathered by itemgetter in C rather than by a dict.get() per field.
+_char_coords = itemgetter("x0", "top", "x1", "bottom", "size", "doctop")
+_word_coords = itemgetter("x0", "top", "x1", "bottom", "doctop")
+
+
+def extract_chars(chars):
+    """Extract char dicts with only the fields we care about."""
+    coords = round_coords(list(map(_char_coords, chars)))
+    return [
+        {
+            "text": c.get("text", ""),
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
+            "fontname": c.get("fontname", ""),
+            "size": size,
+            "doctop": doctop,
+            "upright": c.get("upright", True),
+        }
+        for c, (x0, top, x1, bottom, size, doctop) in zip(chars, coords)
+    ]
+
+
+def extract_words(words):
+    """Extract word dicts."""
+    coords = round_coords(list(map(_word_coords, words)))
+    return [
+        {
+            "text": w.get("text", ""),
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
+            "doctop": doctop,
+        }
+        for w, (x0, top, x1, bottom, doctop) in zip(words, coords)
+    ]
+
+
+def extract_lines(objs):
+    """Extract line dicts."""
+    coords = round_coords([
+        [obj.get("x0"), obj.get("top"), obj.get("x1"), obj.get("bottom"),
+         obj.get("linewidth", obj.get("line_width"))]
+        for obj in objs
+    ])
+    return [
+        {
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
+            "linewidth": linewidth,
+        }
+        for x0, top, x1, bottom, linewidth in coords
+    ]
+
+
+def extract_rects(objs):
+    """Extract rect dicts."""
+    coords = round_coords([
+        [obj.get("x0"), obj.get("top"), obj.get("x1"), obj.get("bottom"),
+         obj.get("linewidth", obj.get("line_width"))]
+        for obj in objs
+    ])
+    return [
+        {
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
+            "linewidth": linewidth,
+            "stroke": obj.get("stroke", obj.get("stroking_color") is not None),
+            "fill": obj.get("fill", obj.get("non_stroking_color") is not None),
+        }
+        for obj, (x0, top, x1, bottom, linewidth) in zip(objs, coords)
+    ]
 
 
 def extract_table(table):
     """Extract table as list of rows (list of cell strings)."""
-    rows = []
-    for row in table.cells if hasattr(table, "cells") else []:
-        rows.append(row)
-
     # Use the extract() method which gives us a list of rows
     extracted = table.extract()
     bbox = table.bbox  # (x0, top, x1, bottom)
@@ -104,20 +209,25 @@ def extract_table(table):
     }
 
 
-def process_page(page):
-    """Process a single page and return its golden data."""
-    chars = [extract_char(c) for c in page.chars]
-    words = [extract_word(w) for w in page.extract_words()]
+def process_page(page, warnings):
+    """Process a single page and return its golden data.
+
+    Non-fatal problems are appended to warnings rather than printed, since
+    pages may be extracted in a worker process whose stdout is discarded.
+    """
+    chars = extract_chars(page.chars)
+    words = extract_words(page.extract_words())
     text = page.extract_text() or ""
-    lines = [extract_line(l) for l in page.lines]
-    rects = [extract_rect(r) for r in page.rects]
+    lines = extract_lines(page.lines)
+    rects = extract_rects(page.rects)
 
     tables_data = []
     try:
-        tables = page.find_tables()
-        tables_data = [extract_table(t) for t in tables]
+        if len(page.edges) >= MIN_TABLE_EDGES:
+            tables = page.find_tables()
+            tables_data = [extract_table(t) for t in tables]
     except Exception as e:
-        print(f"  Warning: table extraction failed on page {page.page_number}: {e}")
+        warnings.append(f"  Warning: table extraction failed on page {page.page_number}: {e}")
 
     return {
         "page_number": page.page_number - 1,  # 0-indexed
@@ -132,32 +242,122 @@ def process_page(page):
     }
 
 
-def process_pdf(pdf_path):
-    """Process an entire PDF and return golden data."""
+def read_pdf(pdf_path):
+    """Read pdf_path into memory in a single call for pdfplumber to parse.
+
+    pdfminer seeks and reads in small chunks throughout parsing, which is
+    cheaper to serve from memory than from the file.
+    """
+    with open(pdf_path, "rb") as f:
+        return io.BytesIO(f.read())
+
+
+def encode_page(page, pretty=False):
+    """Process a single page and return (warnings, summary, page_json).
+
+    page_json is the page's golden data already encoded. When pretty, it is
+    indented to sit inside the document's "pages" array; JSON strings never
+    contain raw newlines, so re-indenting line by line is safe.
+    """
+    warnings = []
+    try:
+        page_data = process_page(page, warnings)
+    finally:
+        # pdfplumber caches parsed objects on each Page, and pdf.pages keeps
+        # every Page alive until the document closes. Drop the cache once the
+        # page is extracted so memory stays flat on long PDFs.
+        page.close()
+    summary = (
+        f"  Page {page_data['page_number']}: "
+        f"{len(page_data['chars'])} chars, {len(page_data['words'])} words, "
+        f"{len(page_data['lines'])} lines, "
+        f"{len(page_data['rects'])} rects, "
+        f"{len(page_data['tables'])} tables"
+    )
+    page_json = encode_json(page_data, pretty)
+    if pretty:
+        page_json = page_json.replace(b"\n", b"\n" + PAGE_INDENT)
+    return warnings, summary, page_json
+
+
+def _extract_page(pdf_path, page_index, initial_doctop, pretty=False):
+    """Encode a single page of pdf_path in a worker process.
+
+    Only the path and index cross the process boundary, since pdfminer's
+    object graph does not pickle. Opening with pages=[n] makes pdfplumber
+    start doctop at 0, so the caller passes in the page's real offset.
+    """
+    with pdfplumber.open(pdf_path, pages=[page_index + 1]) as pdf:
+        page = pdf.pages[0]
+        page.initial_doctop = initial_doctop
+        return encode_page(page, pretty)
+
+
+def _write_pages(out, encoded_pages, pretty):
+    """Write encode_page() results to out as "pages" items; return the count."""
+    if pretty:
+        first_sep, sep = b"\n" + PAGE_INDENT, b",\n" + PAGE_INDENT
+    else:
+        first_sep, sep = b"", b","
+    n_pages = 0
+    for warnings, summary, page_json in encoded_pages:
+        for warning in warnings:
+            print(warning)
+        print(summary)
+        out.write(sep if n_pages else first_sep)
+        out.write(page_json)
+        n_pages += 1
+    return n_pages
+
+
+def process_pdf(pdf_path, out, page_workers=1, pretty=False):
+    """Process an entire PDF and stream its golden JSON to the binary file out.
+
+    Each page is written as soon as it is extracted, so memory stays bounded
+    by one page rather than the whole document. The bytes written are the
+    same encode_json(..., pretty) gives for the whole document. With
+    page_workers > 1, pages are extracted in parallel worker processes.
+    """
     filename = os.path.basename(pdf_path)
     print(f"Processing: {filename}")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        pages = []
-        for page in pdf.pages:
-            page_data = process_page(page)
-            n_chars = len(page_data["chars"])
-            n_words = len(page_data["words"])
-            n_tables = len(page_data["tables"])
-            print(
-                f"  Page {page_data['page_number']}: "
-                f"{n_chars} chars, {n_words} words, "
-                f"{len(page_data['lines'])} lines, "
-                f"{len(page_data['rects'])} rects, "
-                f"{n_tables} tables"
+    header = encode_json({
+        "source": filename,
+        "pdfplumber_version": PDFPLUMBER_VERSION,
+    }, pretty)
+    # Reopen the header object (drop its closing "}") to add "pages".
+    if pretty:
+        out.write(header[:-2])
+        out.write(b',\n  "pages": [')
+    else:
+        out.write(header[:-1])
+        out.write(b',"pages":[')
+
+    if page_workers > 1:
+        with pdfplumber.open(pdf_path) as pdf:
+            initial_doctops = [page.initial_doctop for page in pdf.pages]
+        with ProcessPoolExecutor(max_workers=page_workers) as executor:
+            n_pages = _write_pages(
+                out,
+                executor.map(
+                    partial(_extract_page, pdf_path, pretty=pretty),
+                    range(len(initial_doctops)),
+                    initial_doctops,
+                ),
+                pretty,
+            )
+    else:
+        with pdfplumber.open(read_pdf(pdf_path)) as pdf:
+            n_pages = _write_pages(
+                out, (encode_page(page, pretty) for page in pdf.pages), pretty
             )
-            pages.append(page_data)
 
-    return {
-        "source": filename,
-        "pdfplumber_version": pdfplumber.__version__,
-        "pages": pages,
-    }
+    if not pretty:
+        out.write(b"]}")
+    elif n_pages:
+        out.write(b"\n  ]\n}")
+    else:
+        out.write(b"]\n}")
 
 
 def collect_pdfs(base_dir):
@@ -173,7 +373,133 @@ def collect_pdfs(base_dir):
     return results
 
 
+def count_pages(pdf_path):
+    """Return the page count of pdf_path, or 0 if it cannot be opened."""
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+    except Exception:
+        return 0
+
+
+def _process_one(job, page_workers=1, pretty=False):
+    """Process one (rel_path, pdf_path, json_path) job.
+
+    Runs in a file-pool worker, or in the parent for large PDFs, and writes
+    json_path itself so page data never has to travel back to the parent.
+    Returns (rel_path, json_path, log, error). In a file-pool worker stdout is
+    captured into log so per-PDF output is not interleaved with other workers;
+    large PDFs run alone in the parent and print progress as they go. error is
+    None on success.
+    """
+    rel_path, pdf_path, json_path = job
+    os.makedirs(os.path.dirname(json_path), exist_ok=True)
+
+    log = io.StringIO()
+    error = None
+    if page_workers == 1:
+        capture = contextlib.redirect_stdout(log)
+    else:
+        capture = contextlib.nullcontext()
+    with capture:
+        # Write beside the target and rename into place, so a crash mid-write
+        # leaves the previous golden file intact rather than truncated.
+        tmp_path = json_path + ".tmp"
+        try:
+            with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as out:
+                process_pdf(pdf_path, out, page_workers, pretty)
+            os.replace(tmp_path, json_path)
+        except Exception as e:
+            # Stringify here: pdfminer exceptions are not always picklable.
+            error = str(e)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+    return rel_path, json_path, log.getvalue(), error
+
+
+def _run_isolated(job, pretty=False):
+    """Run _process_one for job in a worker process of its own.
+
+    Used to retry jobs lost to a dead worker, so a crash fails only the PDF
+    that causes it.
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(_process_one, job, pretty=pretty).result()
+        except BrokenProcessPool:
+            rel_path, _pdf_path, json_path = job
+            return rel_path, json_path, "", "worker process died"
+
+
+def _iter_results(small_jobs, large_jobs, processes, pretty):
+    """Yield _process_one results, parallel across files then across pages.
+
+    Large PDFs are processed afterwards in the parent, one at a time, so their
+    page pool has the CPUs to itself rather than nesting inside the file pool.
+    """
+    # A worker that dies outright (OOM kill, segfault) breaks the executor,
+    # which then fails every job it still holds; those are retried one by one.
+    broken = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {}
+        for job in small_jobs:
+            try:
+                futures[executor.submit(_process_one, job, pretty=pretty)] = job
+            except BrokenProcessPool:
+                broken.append(job)
+        # as_completed lets short PDFs finish without waiting behind a slow one.
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                broken.append(futures[future])
+            else:
+                yield result
+    for job in broken:
+        yield _run_isolated(job, pretty)
+    for job in large_jobs:
+        yield _process_one(job, page_workers=processes, pretty=pretty)
+
+
+def verify_golden(golden_files):
+    """Re-read (source, json_path) golden files and check each names its source.
+
+    Returns a list of (json_path, problem). With simdjson one Parser is reused
+    across files and only "source" is materialized from its lazy document;
+    otherwise each file is fully decoded with orjson or json.
+    """
+    parser = simdjson.Parser() if simdjson is not None else None
+    problems = []
+    for source, json_path in golden_files:
+        try:
+            if parser is not None:
+                found = parser.load(json_path)["source"]
+            else:
+                with open(json_path, "rb") as f:
+                    doc = (orjson.loads if orjson is not None else json.loads)(f.read())
+                found = doc["source"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            problems.append((json_path, str(e)))
+            continue
+        if found != source:
+            problems.append((json_path, f"source is {found!r}, expected {source!r}"))
+    return problems
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate golden JSON data from test PDFs.")
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="indent JSON output for human inspection (default: compact)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="re-read the written golden files and check each names its source PDF",
+    )
+    args = parser.parse_args()
+
     os.makedirs(GOLDEN_DIR, exist_ok=True)
 
     pdf_files = collect_pdfs(PDF_DIR)
@@ -182,39 +508,58 @@ def main():
         print("Run scripts/download_test_fixtures.sh first.")
         sys.exit(1)
 
-    print(f"Python pdfplumber version: {pdfplumber.__version__}")
+    print(f"Python pdfplumber version: {PDFPLUMBER_VERSION}")
     print(f"Found {len(pdf_files)} PDF files\n")
 
     succeeded = 0
     failed = 0
     failures = []
+    written = []
 
+    # Each PDF is independent and extraction is CPU-bound inside pdfminer, so
+    # fan out across processes; each job streams its own output file.
+    processes = min(os.cpu_count() or 1, MAX_WORKERS)
+    small_jobs = []
+    large_jobs = []
     for rel_path, pdf_path in pdf_files:
         # Determine output path preserving subdirectory structure
         json_rel = rel_path.replace(".pdf", ".json").replace(".PDF", ".json")
-        json_path = os.path.join(GOLDEN_DIR, json_rel)
-        os.makedirs(os.path.dirname(json_path), exist_ok=True)
-
-        try:
-            golden = process_pdf(pdf_path)
-
-            with open(json_path, "w") as f:
-                json.dump(golden, f, indent=2, ensure_ascii=False)
-
-            print(f"  -> Written: {json_rel}\n")
-            succeeded += 1
-        except Exception as e:
-            print(f"  FAILED: {rel_path}: {e}\n")
+        job = (rel_path, pdf_path, os.path.join(GOLDEN_DIR, json_rel))
+        if processes > 1 and count_pages(pdf_path) >= PAGE_PARALLEL_MIN_PAGES:
+            large_jobs.append(job)
+        else:
+            small_jobs.append(job)
+
+    for rel_path, json_path, log, error in _iter_results(
+        small_jobs, large_jobs, processes, args.pretty
+    ):
+        print(log, end="")
+        if error is not None:
+            print(f"  FAILED: {rel_path}: {error}\n")
             failed += 1
-            failures.append((rel_path, str(e)))
+            failures.append((rel_path, error))
+            continue
+
+        print(f"  -> Written: {os.path.relpath(json_path, GOLDEN_DIR)}\n")
+        succeeded += 1
+        written.append((os.path.basename(rel_path), json_path))
 
     print(f"\nDone! {succeeded} succeeded, {failed} failed.")
     if failures:
         print("\nFailed PDFs:")
-        for rel_path, err in failures:
+        for rel_path, err in sorted(failures):
             print(f"  - {rel_path}: {err}")
     print(f"\nGolden data written to: {GOLDEN_DIR}")
 
+    if args.verify:
+        problems = verify_golden(written)
+        if problems:
+            print("\nVerification failed:")
+            for json_path, problem in sorted(problems):
+                print(f"  - {os.path.relpath(json_path, GOLDEN_DIR)}: {problem}")
+            sys.exit(1)
+        print(f"Verified {len(written)} golden files.")
+
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env bash
 # Setup a Python virtual environment for golden data generation.
-# Creates .venv-golden at the repo root and installs pdfplumber.
+# Creates .venv-golden at the repo root and installs pdfplumber (plus numpy and
+# orjson, which speed up coordinate rounding and JSON output, and pysimdjson
+# for the fast --verify re-read).
 #
 # Usage:
 #   bash scripts/setup_golden_venv.sh
@@ -21,9 +23,9 @@ else
     echo "Virtual environment created."
 fi
 
-echo "Installing pdfplumber ..."
+echo "Installing pdfplumber, numpy, orjson and pysimdjson ..."
 "$VENV_DIR/bin/pip" install --upgrade pip --quiet
-"$VENV_DIR/bin/pip" install pdfplumber --quiet
+"$VENV_DIR/bin/pip" install pdfplumber numpy orjson pysimdjson --quiet
 echo "pdfplumber installed: $("$VENV_DIR/bin/python" -c 'import pdfplumber; print(pdfplumber.__version__)')"
 
 echo ""
@@ -0,0 +1,53 @@
+"""Check the golden generators' vectorized rounding against Python's round().
+
+Usage:
+    python -m pytest scripts/test_golden_rounding.py
+"""
+
+import importlib.util
+import os
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pdfplumber")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load(name, rel_path):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(REPO_ROOT, rel_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ROUNDERS = [
+    _load("golden_scripts", "scripts/generate_golden.py").round_coords,
+    _load("golden_fixtures", "tests/fixtures/generate_golden.py").round_rows,
+]
+
+
+@pytest.mark.parametrize("rounder", ROUNDERS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("exponent", range(-2, 21))
+def test_matches_round_at_every_magnitude(rounder, exponent):
+    rng = random.Random(exponent)
+    values = [
+        rng.choice((-1, 1)) * rng.uniform(10.0 ** exponent, 10.0 ** (exponent + 1))
+        for _ in range(2000)
+    ]
+    rows = [values[i:i + 4] for i in range(0, len(values), 4)]
+    assert rounder(rows) == [[round(v, 4) for v in row] for row in rows]
+
+
+@pytest.mark.parametrize("rounder", ROUNDERS, ids=lambda f: f.__name__)
+def test_matches_round_on_huge_page_sizes(rounder):
+    # Page heights seen in the oss-fuzz fixtures, and values just past the
+    # point where x * 1e4 stops being exact.
+    rows = [
+        [1.8446744073709552e19, 6.171985722375474e19],
+        [123456789012.34567, -987654321098.76543],
+        [0.00005, 2.00005],
+    ]
+    assert rounder(rows) == [[round(v, 4) for v in row] for row in rows]
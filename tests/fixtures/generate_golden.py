@@ -3,14 +3,19 @@
 
 Usage:
     pip install pdfplumber
-    python3 tests/fixtures/generate_golden.py
+    python3 tests/fixtures/generate_golden.py [--pretty] [--verify]
 
 Outputs one JSON per fixture PDF to tests/fixtures/golden/
 """
 
+import argparse
+import contextlib
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from operator import itemgetter
 
 try:
     import pdfplumber
@@ -18,50 +23,104 @@ except ImportError:
     print("pdfplumber is required: pip install pdfplumber", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 FIXTURES_DIR = os.path.dirname(__file__)
 GOLDEN_DIR = os.path.join(FIXTURES_DIR, "golden")
 SOURCE_DIRS = [
     os.path.join(FIXTURES_DIR, "generated"),
     os.path.join(FIXTURES_DIR, "downloaded"),
 ]
+MAX_WORKERS = 6
+PAGE_INDENT = b"    "
+# Fewer edges than this cannot form a table cell.
+MIN_TABLE_EDGES = 4
+
+
+def encode_json(data, pretty=False):
+    """Encode data as UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def round_rows(rows):
+    """Round a list of coordinate rows to 4 decimal places, vectorized with NumPy."""
+    if np is None or not rows:
+        return [[round(v, 4) for v in row] for row in rows]
+    coords = np.array(rows, dtype=np.float64)
+    scaled = coords * 1e4
+    rounded = np.rint(scaled) / 1e4
+    # Redo values near a .5 tie with round() so the output matches it exactly;
+    # the window widens with magnitude to cover the product's rounding error.
+    tie_window = 1e-6 + np.abs(scaled) * 2.0 ** -52
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < tie_window
+    for i, j in zip(*np.nonzero(near_tie)):
+        rounded[i, j] = round(float(coords[i, j]), 4)
+    return rounded.tolist()
+
+
+# Gathers a word's coordinate row in C; pdfplumber always sets these keys.
+_word_coords = itemgetter("x0", "top", "x1", "bottom")
 
 
 def extract_page_data(page):
     """Extract chars, words, and tables from a single page."""
     # Chars
+    page_chars = page.chars
+    char_coords = round_rows([
+        [c["x0"], c["top"], c["x1"], c["bottom"], c.get("size", 0.0)]
+        for c in page_chars
+    ])
     chars = []
-    for c in page.chars:
+    for c, (x0, top, x1, bottom, size) in zip(page_chars, char_coords):
         chars.append({
             "text": c["text"],
-            "x0": round(c["x0"], 4),
-            "top": round(c["top"], 4),
-            "x1": round(c["x1"], 4),
-            "bottom": round(c["bottom"], 4),
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
             "fontname": c.get("fontname", ""),
-            "size": round(c.get("size", 0.0), 4),
+            "size": size,
         })
 
     # Words (default settings)
+    page_words = page.extract_words()
+    word_coords = round_rows(list(map(_word_coords, page_words)))
     words = []
-    for w in page.extract_words():
+    for w, (x0, top, x1, bottom) in zip(page_words, word_coords):
         words.append({
             "text": w["text"],
-            "x0": round(w["x0"], 4),
-            "top": round(w["top"], 4),
-            "x1": round(w["x1"], 4),
-            "bottom": round(w["bottom"], 4),
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
         })
 
     # Tables (default settings)
     tables = []
-    for t in page.find_tables():
+    page_tables = page.find_tables() if len(page.edges) >= MIN_TABLE_EDGES else []
+    for t in page_tables:
         bbox = [round(v, 4) for v in t.bbox]
-        rows = []
-        for row in t.extract():
-            rows.append([cell if cell is not None else None for cell in row])
+        # extract() already returns fresh lists of rows, with None for empty cells.
         tables.append({
             "bbox": bbox,
-            "rows": rows,
+            "rows": t.extract(),
         })
 
     return {
@@ -74,58 +133,198 @@ def extract_page_data(page):
     }
 
 
-def process_pdf(pdf_path, pdf_name):
-    """Process a single PDF and return golden data dict."""
+def encode_page(page, pretty=False):
+    """Extract a single page and return ((chars, words, tables), page_json)."""
+    data = extract_page_data(page)
+    counts = (len(data["chars"]), len(data["words"]), len(data["tables"]))
+    page_json = encode_json(data, pretty)
+    if pretty:
+        page_json = page_json.replace(b"\n", b"\n" + PAGE_INDENT)
+    return counts, page_json
+
+
+def _write_pages(out, encoded_pages, pretty):
+    """Write encoded pages to out and return (pages, chars, words, tables) totals."""
+    if pretty:
+        first_sep, sep = b"\n" + PAGE_INDENT, b",\n" + PAGE_INDENT
+    else:
+        first_sep, sep = b"", b","
+    n_pages = n_chars = n_words = n_tables = 0
+    for (chars, words, tables), page_json in encoded_pages:
+        out.write(sep if n_pages else first_sep)
+        out.write(page_json)
+        n_pages += 1
+        n_chars += chars
+        n_words += words
+        n_tables += tables
+    return n_pages, n_chars, n_words, n_tables
+
+
+def process_pdf(pdf_path, pdf_name, out_path, pretty=False):
+    """Process a single PDF, write its golden JSON to out_path, return totals."""
     try:
         pdf = pdfplumber.open(pdf_path)
     except Exception as e:
         print(f"  SKIP {pdf_name}: {e}", file=sys.stderr)
         return None
 
-    pages = []
-    for page in pdf.pages:
-        pages.append(extract_page_data(page))
-    pdf.close()
+    # Renamed into place at the end, so a failed run keeps the old file.
+    tmp_path = out_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as out:
+            # Reopen the header object (drop its closing "}") to add "pages".
+            header = encode_json({"source": pdf_name}, pretty)
+            if pretty:
+                out.write(header[:-2])
+                out.write(b',\n  "pages": [')
+            else:
+                out.write(header[:-1])
+                out.write(b',"pages":[')
 
-    return {
-        "source": pdf_name,
-        "pages": pages,
-    }
+            totals = _write_pages(
+                out, (encode_page(page, pretty) for page in pdf.pages), pretty
+            )
+
+            if not pretty:
+                out.write(b"]}")
+            elif totals[0]:
+                out.write(b"\n  ]\n}")
+            else:
+                out.write(b"]\n}")
+        os.replace(tmp_path, out_path)
+    except Exception:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    finally:
+        pdf.close()
+
+    return totals
+
+
+def _process_one(job, pretty=False):
+    """Process one (pdf_path, pdf_name, out_path) job and return its summary line."""
+    pdf_path, fname, out_path = job
+    totals = process_pdf(pdf_path, fname, out_path, pretty)
+    if totals is None:
+        return None
+
+    n_pages, total_chars, total_words, total_tables = totals
+    return (f"  {os.path.basename(out_path)}  ({n_pages} pages, "
+            f"{total_chars} chars, {total_words} words, {total_tables} tables)")
+
+
+def _run_isolated(job, pretty=False):
+    """Run one job in a worker process of its own; None if that worker dies."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(_process_one, job, pretty).result()
+        except BrokenProcessPool:
+            print(f"  FAILED {job[1]}: worker process died", file=sys.stderr)
+            return None
+
+
+def _iter_summaries(jobs, processes, pretty=False):
+    """Yield _process_one summaries from a pool of worker processes."""
+    # A dead worker fails every job still pending in the pool, so retry those
+    # alone to find the one that actually crashes.
+    broken = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {}
+        for job in jobs:
+            try:
+                futures[executor.submit(_process_one, job, pretty)] = job
+            except BrokenProcessPool:
+                broken.append(job)
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except BrokenProcessPool:
+                broken.append(futures[future])
+            else:
+                yield summary
+    for job in broken:
+        yield _run_isolated(job, pretty)
+
+
+def verify_golden(golden_files):
+    """Check that each (pdf_name, out_path) golden file parses and names its PDF."""
+    parser = simdjson.Parser() if simdjson is not None else None
+    problems = []
+    for source, json_path in golden_files:
+        try:
+            if parser is not None:
+                found = parser.load(json_path)["source"]
+            else:
+                with open(json_path, encoding="utf-8") as f:
+                    found = json.load(f)["source"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            problems.append((json_path, str(e)))
+            continue
+        if found != source:
+            problems.append((json_path, f"source is {found!r}, expected {source!r}"))
+    return problems
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Generate golden reference JSON from Python pdfplumber."
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="indent JSON output for human inspection (default: compact)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="re-read the written golden files and check each names its source PDF",
+    )
+    args = parser.parse_args()
+
     os.makedirs(GOLDEN_DIR, exist_ok=True)
-    count = 0
 
+    jobs = []
     for src_dir in SOURCE_DIRS:
         if not os.path.isdir(src_dir):
             print(f"  Directory not found: {src_dir}", file=sys.stderr)
             continue
 
-        for fname in sorted(os.listdir(src_dir)):
-            if not fname.endswith(".pdf"):
-                continue
-
-            pdf_path = os.path.join(src_dir, fname)
-            stem = os.path.splitext(fname)[0]
+        with os.scandir(src_dir) as it:
+            entries = sorted(
+                (entry for entry in it if entry.name.endswith(".pdf")),
+                key=lambda entry: entry.name,
+            )
+        for entry in entries:
+            stem = os.path.splitext(entry.name)[0]
             out_path = os.path.join(GOLDEN_DIR, f"{stem}.json")
+            jobs.append((entry.path, entry.name, out_path))
 
-            data = process_pdf(pdf_path, fname)
-            if data is None:
-                continue
-
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+    # PDFs are independent, so extract them in parallel.
+    processes = min(os.cpu_count() or 1, MAX_WORKERS)
+    count = 0
+    for summary in _iter_summaries(jobs, processes, args.pretty):
+        if summary is None:
+            continue
 
-            total_chars = sum(len(p["chars"]) for p in data["pages"])
-            total_words = sum(len(p["words"]) for p in data["pages"])
-            total_tables = sum(len(p["tables"]) for p in data["pages"])
-            print(f"  {stem}.json  ({len(data['pages'])} pages, "
-                  f"{total_chars} chars, {total_words} words, {total_tables} tables)")
-            count += 1
+        print(summary)
+        count += 1
 
     print(f"Done! Generated {count} golden JSON files in {GOLDEN_DIR}")
 
+    if args.verify:
+        # Skipped PDFs may still have a golden file from an earlier run.
+        golden_files = [
+            (fname, out_path) for _, fname, out_path in jobs if os.path.exists(out_path)
+        ]
+        problems = verify_golden(golden_files)
+        if problems:
+            print("Verification failed:", file=sys.stderr)
+            for out_path, problem in sorted(problems):
+                print(f"  {os.path.basename(out_path)}: {problem}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Verified {len(golden_files)} golden JSON files")
+
 
 if __name__ == "__main__":
     main()